@@ -1,159 +1,517 @@
 import requests
+from requests.adapters import HTTPAdapter
+import asyncio
+import contextlib
+import json
+import math
+import mmap
+import random
 import re
+import shelve
+import sys
 import time
 import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from typing import Dict, Optional, List
-from datetime import datetime
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+try:
+    from aiolimiter import AsyncLimiter
+except ImportError:
+    AsyncLimiter = None
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+try:
+    import httpx
+    import h2  # httpx needs it for http2=True
+except ImportError:
+    httpx = None
+
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+def _loads_dict(body: bytes) -> Optional[Dict]:
+    """Decode a JSON object body, or return None if it is not one (e.g. an HTML error page)."""
+    try:
+        data = _loads(body)
+    except ValueError:
+        return None
+    return data if isinstance(data, dict) else None
+
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0 Safari/537.36',
+    'Accept': 'application/json'
+}
+
+_SESSION = requests.Session()
+_SESSION.headers.update(HEADERS)
+_SESSION.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=64, max_retries=0))
+
+_GIFT_RE = re.compile(r'(?:discord\.gift|discord(?:app)?\.com/gifts|promos\.discord\.gg)/([A-Za-z0-9]{16,25})')
+_BARE_RE = re.compile(r'^[A-Za-z0-9]{16,25}$')
 
 def extract_gift_code(text: str) -> Optional[str]:
     """Extract gift code from URL or return the code if it's already extracted."""
-    patterns = [
-        r'discord\.gift/([A-Za-z0-9]{16,25})',
-        r'discord\.com/gifts/([A-Za-z0-9]{16,25})',
-        r'discordapp\.com/gifts/([A-Za-z0-9]{16,25})',
-        r'promos\.discord\.gg/([A-Za-z0-9]{16,25})'
-    ]
+    match = _GIFT_RE.search(text)
+    if match:
+        return match.group(1)
+    
+    text = text.strip()
+    if _BARE_RE.match(text):
+        return text
     
-    for pattern in patterns:
-        match = re.search(pattern, text)
-        if match:
-            return match.group(1)
+    return None
+
+API_URL = "https://discord.com/api/v9/entitlements/gift-codes/{code}"
+API_PARAMS = {
+    'with_application': 'false',
+    'with_subscription_plan': 'true'
+}
+
+_EMOJI_CLAIMED = '❌'
+_EMOJI_OK = '✅'
+_EMOJI_INVALID = '⚠️'
+_EMOJI_RL = '⏳'
+_EMOJI_ERROR = '❌'
+
+# Keyed by "is the code used up?"
+_STATUS_TABLE = {
+    True: ('CLAIMED', _EMOJI_CLAIMED),
+    False: ('CLAIMABLE', _EMOJI_OK)
+}
+
+_GIFT_FIELDS = ('redeemed', 'uses', 'max_uses')
+
+_FIELDS_RE = re.compile(rb'"(redeemed|uses|max_uses)"\s*:\s*(true|false|\d+)')
+_PLAN_KEY_RE = re.compile(rb'"subscription_plan"\s*:\s*')
+_PLAN_NAME_RE = re.compile(rb'\{[^{}]*?"name"\s*:\s*("(?:[^"\\]|\\.)*")')
+
+def _parse_gift_fields(body: bytes) -> Optional[Dict]:
+    """Scan the response body for the few fields we use instead of decoding all of it.
     
-    if re.match(r'^[A-Za-z0-9]{16,25}$', text.strip()):
-        return text.strip()
+    Only keys that come before the first nested object are trusted, since those
+    are certainly top-level. Returns None when the body is laid out in a way
+    the scan can't read safely, so the caller can decode it properly instead.
+    """
+    if not body.lstrip().startswith(b'{'):
+        return None
+    nested = body.find(b'{', body.find(b'{') + 1)
+    top = body if nested == -1 else body[:nested]
     
+    data = {}
+    for key, value in _FIELDS_RE.findall(top):
+        data[key.decode()] = value == b'true' if value in (b'true', b'false') else int(value)
+    if len(data) < len(_GIFT_FIELDS):
+        return None
+    
+    key_match = _PLAN_KEY_RE.search(top)
+    if key_match:
+        if body.startswith(b'null', key_match.end()):
+            return data
+        # The plan is the first nested object, so its own keys start at `nested`
+        if key_match.end() != nested:
+            return None
+        name_match = _PLAN_NAME_RE.match(body, nested)
+        if not name_match:
+            return None
+        try:
+            data['subscription_plan'] = {'name': _loads(name_match.group(1))}
+        except ValueError:
+            return None
+    elif b'"subscription_plan"' in body:
+        return None
+    
+    return data
+
+def _gift_summary(data: Dict) -> tuple:
+    plan = data.get('subscription_plan') or {}
+    return tuple(data.get(key) for key in _GIFT_FIELDS) + (plan.get('name'),)
+
+def _success_result(code: str, body: bytes, debug: bool = False) -> Dict:
+    """Build the result for a 200 response from the gift code endpoint."""
+    if debug:
+        data = _loads_dict(body)
+        if data is not None:
+            print(f"\nDEBUG - Raw API Response:")
+            print(f"{data}\n")
+            scanned = _parse_gift_fields(body)
+            if scanned is not None and _gift_summary(scanned) != _gift_summary(data):
+                print(f"DEBUG - Field scan disagrees with full decode: {_gift_summary(scanned)}\n")
+    else:
+        data = _parse_gift_fields(body)
+        if data is None:
+            data = _loads_dict(body)
+    
+    if data is None or not any(key in data for key in _GIFT_FIELDS):
+        return _error_result(code, 'Unreadable response from Discord')
+    
+    get = data.get
+    uses = get('uses', 0)
+    max_uses = get('max_uses', 1)
+    claimed = bool(get('redeemed', False) or uses >= max_uses)
+    plan_name = (get('subscription_plan') or {}).get('name', 'Unknown')
+    
+    status, status_emoji = _STATUS_TABLE[claimed]
+    
+    extra_info = ""
+    if uses > 0 or max_uses > 1:
+        extra_info = f" (Uses: {uses}/{max_uses})"
+    
+    result = {
+        'code': code,
+        'valid': True,
+        'status': status,
+        'emoji': status_emoji,
+        'plan': plan_name,
+        'uses': uses,
+        'max_uses': max_uses,
+        'message': f"{status_emoji} Code is {status} - {plan_name}{extra_info}"
+    }
+    # Only debug mode decodes the full body, so only it has raw data to keep
+    if debug:
+        result['raw_data'] = data
+    return result
+
+def _invalid_result(code: str) -> Dict:
+    return {
+        'code': code,
+        'valid': False,
+        'status': 'INVALID',
+        'emoji': _EMOJI_INVALID,
+        'plan': 'N/A',
+        'message': f'{_EMOJI_INVALID} Code is INVALID (Unknown Gift Code)'
+    }
+
+def _rate_limited_result(code: str) -> Dict:
+    return {
+        'code': code,
+        'valid': False,
+        'status': 'RATE_LIMITED',
+        'emoji': _EMOJI_RL,
+        'plan': 'N/A',
+        'message': f'{_EMOJI_RL} Rate limited - Try again later or increase delay'
+    }
+
+def _error_result(code: str, message: str) -> Dict:
+    return {
+        'code': code,
+        'valid': False,
+        'status': 'ERROR',
+        'emoji': _EMOJI_ERROR,
+        'plan': 'N/A',
+        'message': f'{_EMOJI_ERROR} {message}'
+    }
+
+CACHE_FILE = 'promo_cache.db'
+
+# Statuses that can never change, so a cached answer is as good as a fresh one
+_TERMINAL_STATUSES = {'CLAIMED', 'INVALID'}
+
+def _cached_result(cache, code: str) -> Optional[Dict]:
+    """Return a previously stored terminal result for a code, if there is one."""
+    if cache is None:
+        return None
+    result = cache.get(code)
+    if result and result['status'] in _TERMINAL_STATUSES:
+        return result
     return None
 
-def check_promo_code(code: str, debug: bool = False, max_retries: int = 3) -> Dict:
+def _store_result(cache, result: Dict) -> Dict:
+    """Remember terminal results so later checks can skip the API call."""
+    if cache is not None and result['status'] in _TERMINAL_STATUSES:
+        # raw_data is a debug-only view of this one response; don't hand it to later callers
+        cache[result['code']] = {key: value for key, value in result.items() if key != 'raw_data'}
+    return result
+
+def _parse_retry_after(value: Optional[str], default: float = 3) -> float:
+    """Read a Retry-After header given either as seconds or as an HTTP-date."""
+    if not value:
+        return default
+    try:
+        seconds = float(value)
+    except ValueError:
+        pass
+    else:
+        return max(seconds, 0) if math.isfinite(seconds) else default
+    
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return default
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0)
+
+def _rate_limit_wait(retry_after: float, attempt: int, cap: float = 30) -> float:
+    """Exponential backoff with jitter, never shorter than what Discord asked for."""
+    # The cap limits our own backoff growth, not Discord's Retry-After
+    cap = max(cap, retry_after)
+    base = min(retry_after * (2 ** attempt), cap)
+    return random.uniform(base, min(cap, base * 3))
+
+def check_promo_code(code: str, debug: bool = False, max_retries: int = 3, cache=None) -> Dict:
     """Check Discord promo/gift code status without claiming it."""
-    url = f"https://discord.com/api/v9/entitlements/gift-codes/{code}"
-    params = {
-        'with_application': 'false',
-        'with_subscription_plan': 'true'
-    }
+    if not debug:
+        cached = _cached_result(cache, code)
+        if cached:
+            return cached
+    
+    url = API_URL.format(code=code)
     
     for attempt in range(max_retries):
         try:
-            response = requests.get(url, params=params, timeout=10)
+            response = _SESSION.get(url, params=API_PARAMS, timeout=10)
             
             if response.status_code == 200:
-                data = response.json()
-                
-                if debug:
-                    print(f"\nDEBUG - Raw API Response:")
-                    print(f"{data}\n")
-                
-                is_redeemed = data.get('redeemed', False)
-                uses = data.get('uses', 0)
-                max_uses = data.get('max_uses', 1)
-                
-                plan_info = data.get('subscription_plan', {})
-                plan_name = plan_info.get('name', 'Unknown')
-                
-                if is_redeemed or uses >= max_uses:
-                    status = "CLAIMED"
-                    status_emoji = "❌"
-                else:
-                    status = "CLAIMABLE"
-                    status_emoji = "✅"
-                
-                extra_info = ""
-                if uses > 0 or max_uses > 1:
-                    extra_info = f" (Uses: {uses}/{max_uses})"
-                
-                return {
-                    'code': code,
-                    'valid': True,
-                    'status': status,
-                    'emoji': status_emoji,
-                    'plan': plan_name,
-                    'uses': uses,
-                    'max_uses': max_uses,
-                    'message': f"{status_emoji} Code is {status} - {plan_name}{extra_info}",
-                    'raw_data': data if debug else None
-                }
+                return _store_result(cache, _success_result(code, response.content, debug))
             
             elif response.status_code == 404:
-                return {
-                    'code': code,
-                    'valid': False,
-                    'status': 'INVALID',
-                    'emoji': '⚠️',
-                    'plan': 'N/A',
-                    'message': '⚠️ Code is INVALID (Unknown Gift Code)'
-                }
+                return _store_result(cache, _invalid_result(code))
             
             elif response.status_code == 429:
                 if attempt < max_retries - 1:
-                    retry_after = int(response.headers.get('Retry-After', 3))
-                    wait_time = min(retry_after * (2 ** attempt), 30)
+                    retry_after = _parse_retry_after(response.headers.get('Retry-After'))
+                    wait_time = _rate_limit_wait(retry_after, attempt)
                     if debug:
-                        print(f"Rate limited, waiting {wait_time}s before retry {attempt + 1}/{max_retries}...")
+                        print(f"Rate limited, waiting {wait_time:.1f}s before retry {attempt + 1}/{max_retries}...")
                     time.sleep(wait_time)
                     continue
                 else:
-                    return {
-                        'code': code,
-                        'valid': False,
-                        'status': 'RATE_LIMITED',
-                        'emoji': '⏳',
-                        'plan': 'N/A',
-                        'message': '⏳ Rate limited - Try again later or increase delay'
-                    }
+                    return _rate_limited_result(code)
             
             else:
-                error_data = response.json() if response.text else {}
+                raw = response.content
+                error_data = (_loads_dict(raw) if raw else None) or {}
                 error_msg = error_data.get('message', 'Unknown error')
                 
-                return {
-                    'code': code,
-                    'valid': False,
-                    'status': 'ERROR',
-                    'emoji': '❌',
-                    'plan': 'N/A',
-                    'message': f'❌ Error checking code: {error_msg}'
-                }
+                return _error_result(code, f'Error checking code: {error_msg}')
         
         except requests.exceptions.RequestException as e:
             if attempt < max_retries - 1:
                 wait_time = min(2 * (2 ** attempt), 10)
                 time.sleep(wait_time)
                 continue
-            return {
-                'code': code,
-                'valid': False,
-                'status': 'ERROR',
-                'emoji': '❌',
-                'plan': 'N/A',
-                'message': f'❌ Network error: {str(e)}'
-            }
+            return _error_result(code, f'Network error: {e}')
     
-    return {
-        'code': code,
-        'valid': False,
-        'status': 'ERROR',
-        'emoji': '❌',
-        'plan': 'N/A',
-        'message': f'❌ Max retries exceeded'
-    }
+    return _error_result(code, 'Max retries exceeded')
+
+async def _fetch_aiohttp(session, url: str):
+    async with session.get(url, params=API_PARAMS) as response:
+        return response.status, response.headers.get('Retry-After'), await response.read()
+
+async def _fetch_httpx(client, url: str):
+    response = await client.get(url, params=API_PARAMS)
+    return response.status_code, response.headers.get('Retry-After'), response.content
 
-def bulk_check_from_file(filename: str, output_file: str = None, delay: float = 2.5):
+_ASYNC_NETWORK_ERRORS = (asyncio.TimeoutError,)
+if aiohttp is not None:
+    _ASYNC_NETWORK_ERRORS += (aiohttp.ClientError,)
+if httpx is not None:
+    _ASYNC_NETWORK_ERRORS += (httpx.RequestError,)
+
+def _async_client(concurrency: int):
+    """Open the async HTTP client for bulk mode, preferring HTTP/2 via httpx."""
+    if httpx is not None:
+        limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+        return httpx.AsyncClient(http2=True, limits=limits, timeout=10, headers=HEADERS)
+    
+    connector = aiohttp.TCPConnector(limit_per_host=concurrency, keepalive_timeout=75)
+    timeout = aiohttp.ClientTimeout(total=10)
+    return aiohttp.ClientSession(connector=connector, timeout=timeout, headers=HEADERS)
+
+async def check_promo_code_async(session, code: str, limiter, debug: bool = False, max_retries: int = 3, cache=None) -> Dict:
+    """Async variant of check_promo_code used by bulk mode."""
+    if not debug:
+        cached = _cached_result(cache, code)
+        if cached:
+            return cached
+    
+    url = API_URL.format(code=code)
+    if httpx is not None and isinstance(session, httpx.AsyncClient):
+        fetch = _fetch_httpx
+    else:
+        fetch = _fetch_aiohttp
+    
+    for attempt in range(max_retries):
+        try:
+            async with limiter:
+                status_code, retry_header, body = await fetch(session, url)
+        except _ASYNC_NETWORK_ERRORS as e:
+            if attempt < max_retries - 1:
+                wait_time = min(2 * (2 ** attempt), 10)
+                await asyncio.sleep(wait_time)
+                continue
+            return _error_result(code, f'Network error: {e}')
+        
+        if status_code == 200:
+            return _store_result(cache, _success_result(code, body, debug))
+        
+        elif status_code == 404:
+            return _store_result(cache, _invalid_result(code))
+        
+        elif status_code == 429:
+            if attempt < max_retries - 1:
+                retry_after = _parse_retry_after(retry_header)
+                wait_time = _rate_limit_wait(retry_after, attempt)
+                if debug:
+                    print(f"Rate limited, waiting {wait_time:.1f}s before retry {attempt + 1}/{max_retries}...")
+                await asyncio.sleep(wait_time)
+                continue
+            else:
+                return _rate_limited_result(code)
+        
+        else:
+            error_data = (_loads_dict(body) if body else None) or {}
+            error_msg = error_data.get('message', 'Unknown error')
+            
+            return _error_result(code, f'Error checking code: {error_msg}')
+    
+    return _error_result(code, 'Max retries exceeded')
+
+# Status -> (results bucket, one-line progress label)
+_DISPATCH = {
+    'CLAIMABLE': ('claimable', lambda r: f"{_EMOJI_OK} CLAIMABLE - {r['plan']}"),
+    'CLAIMED': ('claimed', lambda r: f"{_EMOJI_CLAIMED} CLAIMED - {r['plan']}"),
+    'INVALID': ('invalid', lambda r: f"{_EMOJI_INVALID} INVALID"),
+    'RATE_LIMITED': ('rate_limited', lambda r: f"{_EMOJI_RL} RATE LIMITED"),
+    'ERROR': ('error', lambda r: f"{_EMOJI_ERROR} ERROR")
+}
+
+def _record_result(results: Dict, result: Dict):
+    """File a result into its category and print its one-line status."""
+    bucket, fmt = _DISPATCH.get(result['status'], _DISPATCH['ERROR'])
+    results[bucket].append(result)
+    print(fmt(result))
+
+def _bulk_check_sync(codes_to_check: List[str], results: Dict, delay: float, cache=None):
+    """Check codes one at a time. Used when no async HTTP client is installed."""
+    # Requests are paced against a deadline, so time spent waiting on the
+    # previous response already counts towards the delay.
+    next_send = time.monotonic()
+    
+    for i, code in enumerate(codes_to_check, 1):
+        print(f"[{i}/{len(codes_to_check)}] Checking: {code}...", end=" ")
+        
+        result = _cached_result(cache, code)
+        if result:
+            _record_result(results, result)
+            continue
+        
+        now = time.monotonic()
+        if now < next_send:
+            time.sleep(next_send - now)
+        next_send = max(now, next_send) + delay
+        
+        result = check_promo_code(code, cache=cache)
+        _record_result(results, result)
+
+async def _bulk_check_async(codes_to_check: List[str], results: Dict, delay: float, concurrency: int, cache=None):
+    """Check codes concurrently while keeping to one request per `delay` seconds."""
+    semaphore = asyncio.Semaphore(concurrency)
+    limiter = AsyncLimiter(1, delay) if delay > 0 else contextlib.nullcontext()
+    done = 0
+    
+    async def worker(session, code: str):
+        nonlocal done
+        result = _cached_result(cache, code)
+        if not result:
+            async with semaphore:
+                try:
+                    result = await check_promo_code_async(session, code, limiter, cache=cache)
+                except Exception as e:
+                    # One bad code must not cancel the gather and lose the whole run
+                    result = _error_result(code, f'Unexpected error: {e}')
+        done += 1
+        print(f"[{done}/{len(codes_to_check)}] Checked: {code}...", end=" ")
+        _record_result(results, result)
+    
+    async with _async_client(concurrency) as session:
+        await asyncio.gather(*[worker(session, code) for code in codes_to_check])
+
+PARALLEL_PARSE_THRESHOLD = 1024 * 1024
+PARSE_BLOCK_SIZE = 64 * 1024
+
+def _code_from_line(line: str) -> Optional[str]:
+    line = line.strip()
+    if line and not line.startswith('#'):
+        return extract_gift_code(line)
+    return None
+
+# Both parsers decode as UTF-8 and split on '\r\n', '\r' and '\n' (universal
+# newlines) so they agree on every input.
+_NEWLINE_RE = re.compile(r'\r\n|\r|\n')
+_LINE_END_RE = re.compile(rb'[\r\n]')
+
+def _parse_file(filename: str):
+    """Yield the gift codes in a file, reading it line by line."""
+    with open(filename, 'r', encoding='utf-8', errors='replace') as f:
+        for line in f:
+            code = _code_from_line(line)
+            if code:
+                yield code
+
+def parse_block(block: bytes) -> List[str]:
+    """Extract the gift codes from a chunk of whole lines of the input file."""
+    codes = []
+    for line in _NEWLINE_RE.split(block.decode('utf-8', errors='replace')):
+        code = _code_from_line(line)
+        if code:
+            codes.append(code)
+    return codes
+
+def _read_blocks(filename: str):
+    """Yield roughly PARSE_BLOCK_SIZE chunks of the file, each ending on a line break.
+    
+    A block may end between the '\r' and '\n' of a CRLF pair; that only adds an
+    empty line, which the parser skips.
+    """
+    with open(filename, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        start = 0
+        size = len(mm)
+        while start < size:
+            match = _LINE_END_RE.search(mm, start + PARSE_BLOCK_SIZE)
+            end = size if match is None else match.end()
+            yield mm[start:end]
+            start = end
+
+def _parse_file_parallel(filename: str, workers: int):
+    """Yield the gift codes in a large file, parsing blocks in worker processes."""
+    # Only a few blocks per worker are in flight at once, so the file is never
+    # held in memory as a whole.
+    window = workers * 2
+    pending = deque()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for block in _read_blocks(filename):
+            if len(pending) >= window:
+                yield from pending.popleft().result()
+            pending.append(executor.submit(parse_block, block))
+        while pending:
+            yield from pending.popleft().result()
+
+def bulk_check_from_file(filename: str, output_file: str = None, delay: float = 2.5, concurrency: int = 8):
     """Check multiple promo codes from a text file."""
     
     if not os.path.exists(filename):
         print(f"❌ Error: File '{filename}' not found!")
         return
     
-    with open(filename, 'r') as f:
-        lines = f.readlines()
+    workers = os.cpu_count() or 1
+    if workers > 1 and os.path.getsize(filename) >= PARALLEL_PARSE_THRESHOLD:
+        found = _parse_file_parallel(filename, workers)
+    else:
+        found = _parse_file(filename)
     
-    codes_to_check = []
-    for line in lines:
-        line = line.strip()
-        if line and not line.startswith('#'):
-            code = extract_gift_code(line)
-            if code:
-                codes_to_check.append(code)
+    # dict.fromkeys keeps first-seen order while dropping duplicate codes
+    codes_to_check = list(dict.fromkeys(found))
     
     if not codes_to_check:
         print("❌ No valid codes found in the file!")
@@ -171,29 +529,11 @@ def bulk_check_from_file(filename: str, output_file: str = None, delay: float =
         'error': []
     }
     
-    for i, code in enumerate(codes_to_check, 1):
-        print(f"[{i}/{len(codes_to_check)}] Checking: {code}...", end=" ")
-        
-        result = check_promo_code(code)
-        
-        if result['status'] == 'CLAIMABLE':
-            results['claimable'].append(result)
-            print(f"✅ CLAIMABLE - {result['plan']}")
-        elif result['status'] == 'CLAIMED':
-            results['claimed'].append(result)
-            print(f"❌ CLAIMED - {result['plan']}")
-        elif result['status'] == 'INVALID':
-            results['invalid'].append(result)
-            print(f"⚠️ INVALID")
-        elif result['status'] == 'RATE_LIMITED':
-            results['rate_limited'].append(result)
-            print(f"⏳ RATE LIMITED")
+    with shelve.open(CACHE_FILE) as cache:
+        if AsyncLimiter is not None and (httpx is not None or aiohttp is not None):
+            asyncio.run(_bulk_check_async(codes_to_check, results, delay, concurrency, cache))
         else:
-            results['error'].append(result)
-            print(f"❌ ERROR")
-        
-        if i < len(codes_to_check):
-            time.sleep(delay)
+            _bulk_check_sync(codes_to_check, results, delay, cache)
     
     print(f"\n{'=' * 70}")
     print("Summary:")
@@ -215,62 +555,47 @@ def bulk_check_from_file(filename: str, output_file: str = None, delay: float =
         default_output = f"results_{timestamp}.txt"
         save_results(results, default_output)
 
+_HDR = "=" * 70 + "\n"
+_SEP = "-" * 70 + "\n"
+
+# (results key, header, (label, result field) pairs, text after the section)
+_SECTIONS = [
+    ('claimable', f"{_EMOJI_OK} CLAIMABLE CODES", (('Code', 'code'), ('Plan', 'plan'), ('Status', 'message')), "\n"),
+    ('claimed', f"{_EMOJI_CLAIMED} CLAIMED CODES", (('Code', 'code'), ('Plan', 'plan')), "\n"),
+    ('invalid', f"{_EMOJI_INVALID} INVALID CODES", (('Code', 'code'),), "\n"),
+    ('rate_limited', f"{_EMOJI_RL} RATE LIMITED CODES", (('Code', 'code'), ('Message', 'message')),
+     "\n💡 TIP: Re-run these codes with a higher delay (3-5 seconds)\n"
+     "to avoid Discord's rate limits.\n\n"),
+    ('error', f"{_EMOJI_ERROR} ERROR CODES", (('Code', 'code'), ('Message', 'message')), "")
+]
+
 def save_results(results: Dict, filename: str):
     """Save checking results to a file."""
-    with open(filename, 'w') as f:
-        f.write("=" * 70 + "\n")
-        f.write(f"Discord Promo Code Check Results - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-        f.write("=" * 70 + "\n\n")
-        
-        if results['claimable']:
-            f.write(f"✅ CLAIMABLE CODES ({len(results['claimable'])}):\n")
-            f.write("-" * 70 + "\n")
-            for r in results['claimable']:
-                f.write(f"Code: {r['code']}\n")
-                f.write(f"Plan: {r['plan']}\n")
-                f.write(f"Status: {r['message']}\n")
-                f.write("-" * 70 + "\n")
-            f.write("\n")
-        
-        if results['claimed']:
-            f.write(f"❌ CLAIMED CODES ({len(results['claimed'])}):\n")
-            f.write("-" * 70 + "\n")
-            for r in results['claimed']:
-                f.write(f"Code: {r['code']}\n")
-                f.write(f"Plan: {r['plan']}\n")
-                f.write("-" * 70 + "\n")
-            f.write("\n")
-        
-        if results['invalid']:
-            f.write(f"⚠️ INVALID CODES ({len(results['invalid'])}):\n")
-            f.write("-" * 70 + "\n")
-            for r in results['invalid']:
-                f.write(f"Code: {r['code']}\n")
-                f.write("-" * 70 + "\n")
-            f.write("\n")
-        
-        if results.get('rate_limited'):
-            f.write(f"⏳ RATE LIMITED CODES ({len(results['rate_limited'])}):\n")
-            f.write("-" * 70 + "\n")
-            for r in results['rate_limited']:
-                f.write(f"Code: {r['code']}\n")
-                f.write(f"Message: {r['message']}\n")
-                f.write("-" * 70 + "\n")
-            f.write("\n")
-            f.write("💡 TIP: Re-run these codes with a higher delay (3-5 seconds)\n")
-            f.write("to avoid Discord's rate limits.\n\n")
-        
-        if results['error']:
-            f.write(f"❌ ERROR CODES ({len(results['error'])}):\n")
-            f.write("-" * 70 + "\n")
-            for r in results['error']:
-                f.write(f"Code: {r['code']}\n")
-                f.write(f"Message: {r['message']}\n")
-                f.write("-" * 70 + "\n")
+    parts = []
+    append = parts.append
     
+    append(_HDR)
+    append(f"Discord Promo Code Check Results - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+    append(_HDR)
+    append("\n")
+    
+    for key, header, fields, footer in _SECTIONS:
+        items = results.get(key)
+        if not items:
+            continue
+        append(f"{header} ({len(items)}):\n")
+        append(_SEP)
+        for r in items:
+            for label, field in fields:
+                append(f"{label}: {r[field]}\n")
+            append(_SEP)
+        append(footer)
+    
+    with open(filename, 'w', encoding='utf-8') as f:
+        f.write(''.join(parts))
     print(f"💾 Results saved to: {filename}\n")
 
-def interactive_mode():
+def interactive_mode(cache=None):
     """Run the checker in interactive mode."""
     print("This tool checks Discord promo/gift codes WITHOUT claiming them.")
     print("Type 'debug' to enable debug mode, 'quit' to exit.\n")
@@ -305,7 +630,7 @@ def interactive_mode():
         print(f"\nChecking code: {code}")
         print("-" * 60)
         
-        result = check_promo_code(code, debug=debug_mode)
+        result = check_promo_code(code, debug=debug_mode, cache=cache)
         
         print(f"Code: {result['code']}")
         print(f"Status: {result['message']}")
@@ -319,6 +644,9 @@ def interactive_mode():
 
 def main():
     """Main function to run the promo code checker."""
+    if hasattr(sys.stdout, 'reconfigure'):
+        sys.stdout.reconfigure(encoding='utf-8')
+    
     print("=" * 70)
     print("Discord Promo Code Checker")
     print("=" * 70)
@@ -333,7 +661,8 @@ def main():
         print("\n" + "=" * 70)
         print("Interactive Mode")
         print("=" * 70 + "\n")
-        interactive_mode()
+        with shelve.open(CACHE_FILE) as cache:
+            interactive_mode(cache)
     elif choice == '2':
         print("\n" + "=" * 70)
         print("Bulk Mode")